@@ -7,14 +7,23 @@ from __future__ import annotations
 import sublime
 import sublime_plugin
 import threading
-import socket, os
+import socket, os, sys
 import enum
 import json
-import base64
 import traceback
-import itertools
 import weakref
 import html
+import functools
+import re
+import collections
+import types
+
+# Use orjson for decoding socket payloads when it's available
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 
 IssuePanelSettings = {
@@ -28,6 +37,37 @@ IssuePanelSettings = {
 }
 
 
+LeftPhantomTemplate = """
+    <body id="build-sock-left">
+        <style>
+            body { padding-top: %ipx; }
+            .dark  #light-disclosure { display: none }
+            .light #dark-disclosure  { display: none }
+        </style>
+        <a href="toggle:" title="%s">%s</a>
+    </body>
+"""
+
+
+# Milliseconds to wait before flushing coalesced view/panel updates
+CoalesceDelay = 40
+
+
+# Window commands that may change a window's folders
+FolderCommandNames = frozenset({
+    "prompt_add_folder",
+    "remove_folder",
+    "close_folder_list",
+    "prompt_open_project_or_workspace",
+    "prompt_switch_project_or_workspace",
+    "open_project_or_workspace",
+    "switch_project_or_workspace",
+    "open_recent_project_or_workspace",
+    "close_project",
+    "close_workspace"
+})
+
+
 class Theme(enum.IntEnum):
     LIGHT = 0,
     DARK  = 1
@@ -56,14 +96,24 @@ class GutterAdjust(enum.IntEnum):
     HIGHEST =  2
 
 
+def check_type(x: Any, type: Any, default: Any = None) -> Any:
+    return x if isinstance(x, type) else default
+
 def get_resource_path(path: str) -> str:
     return os.path.join("Packages/BuildSock/resources/", path)
     
 def get_image_path(path: str) -> str:
     return os.path.join(get_resource_path("images"), path)
+
+def get_resource_url(resource_path: str) -> str:
+    return f"res://{resource_path}"
+
+# Used to match project paths against window folders
+def normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
     
 
-DisclosureImageMap = {
+DisclosureImageMap = types.MappingProxyType({
     ( Theme.LIGHT, DisclosureIcon.NONE      ): get_image_path("disclosure-blank.png"),
     ( Theme.LIGHT, DisclosureIcon.COLLAPSED ): get_image_path("disclosure-collapsed-light.png"),
     ( Theme.LIGHT, DisclosureIcon.EXPANDED  ): get_image_path("disclosure-expanded-light.png"),
@@ -71,18 +121,18 @@ DisclosureImageMap = {
     ( Theme.DARK,  DisclosureIcon.NONE      ): get_image_path("disclosure-blank.png"),
     ( Theme.DARK,  DisclosureIcon.COLLAPSED ): get_image_path("disclosure-collapsed-dark.png"),
     ( Theme.DARK,  DisclosureIcon.EXPANDED  ): get_image_path("disclosure-expanded-dark.png")
-}
+})
 
 
-IssueIconMap = {
+IssueIconMap = types.MappingProxyType({
     IssueType.GENERIC: get_image_path("issue-icon-blank.png"),
     IssueType.INFO:    get_image_path("issue-icon-info.png"),
     IssueType.WARNING: get_image_path("issue-icon-warning.png"),
     IssueType.ERROR:   get_image_path("issue-icon-error.png")
-}
+})
 
 
-GutterIconMap = {
+GutterIconMap = types.MappingProxyType({
     ( GutterIcon.DOT,       GutterAdjust.LOWEST  ): get_image_path("gutter-icon-dot-lowest.png"),
     ( GutterIcon.DOT,       GutterAdjust.LOWER   ): get_image_path("gutter-icon-dot-lower.png"),
     ( GutterIcon.DOT,       GutterAdjust.NORMAL  ): get_image_path("gutter-icon-dot-normal.png"),
@@ -100,9 +150,75 @@ GutterIconMap = {
     ( GutterIcon.OCTOGON,   GutterAdjust.NORMAL  ): get_image_path("gutter-icon-octogon-normal.png"),
     ( GutterIcon.OCTOGON,   GutterAdjust.HIGHER  ): get_image_path("gutter-icon-octogon-higher.png"),
     ( GutterIcon.OCTOGON,   GutterAdjust.HIGHEST ): get_image_path("gutter-icon-octogon-highest.png")
+})
+
+
+# Phantom <img> URLs, resolved once at import
+DisclosureImageURLMap = types.MappingProxyType({
+    key: get_resource_url(path) for key, path in DisclosureImageMap.items()
+})
+
+IssueIconURLMap = types.MappingProxyType({
+    key: get_resource_url(path) for key, path in IssueIconMap.items()
+})
+
+
+IssueTypeMap = {
+    "info":    IssueType.INFO,
+    "warning": IssueType.WARNING,
+    "error":   IssueType.ERROR
 }
 
 
+GutterAdjustMap = {
+    "lowest":  GutterAdjust.LOWEST,
+    "lower":   GutterAdjust.LOWER,
+    "normal":  GutterAdjust.NORMAL,
+    "higher":  GutterAdjust.HIGHER,
+    "highest": GutterAdjust.HIGHEST
+}
+
+
+@functools.lru_cache(maxsize=64)
+def get_left_phantom_images_html(
+    disclosure_icon: DisclosureIcon,
+    issue_type: IssueType,
+    show_disclosures: bool,
+    show_issue_icons: bool,
+    size: int
+) -> str:
+    image_htmls = [ ]
+
+    if show_disclosures:
+        disclosure_light_url = DisclosureImageURLMap[ ( Theme.LIGHT, disclosure_icon ) ]
+        disclosure_dark_url  = DisclosureImageURLMap[ ( Theme.DARK,  disclosure_icon ) ]
+
+        image_htmls.append(f'<img id="light-disclosure" width="{size}" height="{size}" src="{disclosure_light_url}">')
+        image_htmls.append(f'<img id="dark-disclosure"  width="{size}" height="{size}" src="{disclosure_dark_url}">')
+
+    if show_issue_icons:
+        icon_url = IssueIconURLMap[issue_type]
+        image_htmls.append(f'<img width="{size}" height="{size}" src="{icon_url}">')
+
+    return "".join(image_htmls)
+
+
+# Validators for each setting. Invalid values fall back to the package default.
+SettingsSchema = (
+    ( "socket_path",          lambda v: type(v) is str  ),
+    ( "gutter_icon_adjust",   lambda v: type(v) is str  ),
+    ( "issue_icon_adjust",    lambda v: type(v) is int  ),
+    ( "details_font_face",    lambda v: isinstance(v, str) ),
+    ( "details_font_size",    lambda v: isinstance(v, (str, int, float)) ),
+    ( "colorize_issue_panel", lambda v: type(v) is bool ),
+    ( "generic_issue_scope",  lambda v: type(v) is str  ),
+    ( "info_issue_scope",     lambda v: type(v) is str  ),
+    ( "warning_issue_scope",  lambda v: type(v) is str  ),
+    ( "error_issue_scope",    lambda v: type(v) is str  ),
+    ( "issue_panel_settings", lambda v: type(v) is dict )
+)
+
+
 class BuildSockSettings(dict):
     """Wraps sublime.Settings to provide type-safe/valid values."""
 
@@ -121,29 +237,18 @@ class BuildSockSettings(dict):
 
     def _read_settings(self) -> None:
 
-        for key, default_value in self.__defaults.items():
+        for key, check in SettingsSchema:
             value = self.__settings.get(key)
-            
-            if key == "details_font_face":
-                check = lambda: isinstance(value, str)
-            elif key == "details_font_size":
-                check = lambda: isinstance(value, (str, int, float))
-            else:
-                check = lambda: type(value) == type(default_value)
-                        
-            if not check():
-                value = default_value
+
+            if not check(value):
+                value = self.__defaults.get(key)
 
             if key == "gutter_icon_adjust":
-                value = {
-                    "lowest":  GutterAdjust.LOWEST,
-                    "lower":   GutterAdjust.LOWER,
-                    "normal":  GutterAdjust.NORMAL,
-                    "higher":  GutterAdjust.HIGHER,
-                    "highest": GutterAdjust.HIGHEST               
-                }.get(value, GutterAdjust.NORMAL)
+                value = GutterAdjustMap.get(value, GutterAdjust.NORMAL)
             
+            # Also expose as an attribute, so hot paths can avoid dict lookups
             self[key] = value
+            setattr(self, key, value)
 
     
     def _handle_settings_change(self) -> None:
@@ -153,7 +258,7 @@ class BuildSockSettings(dict):
 
 sSpinners = None
 sBuildSockPlugin = None
-sTimeouts = set()
+sTimeouts = weakref.WeakSet()
 
 
 def plugin_loaded():
@@ -170,26 +275,24 @@ def plugin_unloaded():
 def cleanup_plugin():
     global sBuildSockPlugin
 
-    for weak_timeout in sTimeouts.copy():
-        timeout = weak_timeout()
-        if timeout: timeout.cancel()
+    for timeout in list(sTimeouts):
+        timeout.cancel()
     
     if sBuildSockPlugin:
         sBuildSockPlugin.destroy()
 
 
-# Wraps sublime.set_timeout and provides a cancel() method
+# Wraps sublime.set_timeout and provides a cancel() method.
+# Only create on the main thread, as sTimeouts isn't locked.
 class Timeout:
     def __init__(self, callback: Callable, delay: int = 0) -> None:
         self.callback = callback
         sublime.set_timeout(self.__call, delay)
-
-        self.weak_self = weakref.ref(self)
-        sTimeouts.add(self.weak_self)
+        sTimeouts.add(self)
         
     def cancel(self):
         self.callback = None
-        sTimeouts.discard(self.weak_self)
+        sTimeouts.discard(self)
             
     def __call(self):
         if self.callback:
@@ -202,13 +305,31 @@ class Project:
     def __init__(self, path: str) -> None:
         self.path = path
         self.issues = None
+        self.path_to_issues_map = { }
         self.status_message = None
         self.status_spinner = None
 
 
+    def set_issues(self, issues: Optional[list[Issue]]) -> None:
+        path_to_issues_map = { }
+
+        for issue in issues or [ ]:
+            if not issue.path: continue
+
+            issue_set = path_to_issues_map.get(issue.path) or set()
+            issue_set.add(issue)
+            path_to_issues_map[issue.path] = issue_set
+
+        self.issues = issues
+        self.path_to_issues_map = path_to_issues_map
+
+
 
 class Issue():
 
+    # Large builds create many issues, avoid a __dict__ per instance
+    __slots__ = ( "type", "message", "path", "file", "line", "column", "details", "tooltip" )
+
     def __init__(
         self,
         type:    IssueType,
@@ -231,11 +352,16 @@ class Issue():
 
 
 
+
 class ViewManager:
     
     def __init__(self, view: sublime.View) -> None:
         self.view = view
         self.issues = None
+        self.pending_issues = None
+        self.pending_force = False
+        self.region_fingerprints = { }
+        self.drawn_change_count = None
 
 
     def destroy(self):
@@ -246,9 +372,15 @@ class ViewManager:
         self.update_regions()
 
 
-    def set_issues(self, issues: set[Issue]) -> None: 
-        if self.issues == issues: return
+    def set_issues(self, issues: set[Issue], force: bool = False) -> None: 
+        # A forced redraw is only needed if edits may have moved the regions
+        if force and self.view.change_count() == self.drawn_change_count:
+            force = False
+
+        if self.issues == issues and not force: return
         self.issues = issues
+
+        if force: self.region_fingerprints = { }
         self.update_regions()
 
 
@@ -261,14 +393,25 @@ class ViewManager:
             region_key = self.get_region_key(issue_type)
             self.view.erase_regions(region_key)
 
+        self.region_fingerprints = { }
+        self.drawn_change_count = None
 
-    def update_regions(self) -> None:
-        self.erase_regions()
-        if not self.issues: return
 
+    # Returns line start offsets through the line after max_line (1-based),
+    # scanning only as much of the buffer as needed
+    def _get_line_starts(self, max_line: int) -> list[int]:
         view = self.view
-        added_lines = set()
-        active_region_keys = set()
+        text = view.substr(sublime.Region(0, view.text_point(max(max_line, 0), 0)))
+
+        line_starts = [ 0 ]
+        line_starts.extend(m.end() for m in re.finditer("\n", text))
+
+        return line_starts
+
+
+    def update_regions(self) -> None:
+        view = self.view
+        style_table = sBuildSockPlugin.region_style_table
 
         flags = (
             sublime.DRAW_NO_OUTLINE |
@@ -277,35 +420,59 @@ class ViewManager:
             sublime.NO_UNDO
         )
 
-        for issue_type, group in itertools.groupby(self.issues, lambda i: i.type):
-            gutter_icon = {
-                IssueType.WARNING: GutterIcon.TRIANGLE,
-                IssueType.ERROR:   GutterIcon.OCTOGON,
-            }.get(issue_type, GutterIcon.DOT)
+        # Bucket lines by issue type in a single pass. self.issues is unordered,
+        # so each type may appear anywhere in the iteration.
+        buckets = [ set() for _ in IssueType ]
+
+        for issue in self.issues or [ ]:
+            line = issue.line
+            if line: buckets[issue.type].add(line)
+
+        # Only touch region keys whose lines or style differ from the last update
+        fingerprints = { }
+
+        for issue_type in IssueType:
+            lines = buckets[issue_type]
+            if not lines: continue
+
+            scope, gutter_icon_path = style_table[issue_type]
+            fingerprints[issue_type] = ( frozenset(lines), scope, gutter_icon_path )
 
-            scope_settings_key = {
-                IssueType.INFO:    "info_issue_scope",
-                IssueType.WARNING: "warning_issue_scope",
-                IssueType.ERROR:   "error_issue_scope"            
-            }.get(issue_type, "generic_issue_scope")
+        changed_types = [ ]
 
+        for issue_type in IssueType:
+            fingerprint = fingerprints.get(issue_type)
+            if fingerprint == self.region_fingerprints.get(issue_type): continue
+
+            if fingerprint:
+                changed_types.append(issue_type)
+            else:
+                view.erase_regions(self.get_region_key(issue_type))
+
+        # Snapshot line offsets once rather than calling text_point() per line
+        if changed_types:
+            max_line = max(max(fingerprints[t][0]) for t in changed_types)
+            line_starts = self._get_line_starts(max_line)
+            line_count = len(line_starts)
+            view_size = view.size()
+
+        for issue_type in changed_types:
+            lines, scope, gutter_icon_path = fingerprints[issue_type]
             region_key = self.get_region_key(issue_type)
-            scope = sBuildSockPlugin.settings[scope_settings_key]
-            gutter_icon_adjust = sBuildSockPlugin.settings["gutter_icon_adjust"]
-            gutter_icon_path = GutterIconMap[ ( gutter_icon, gutter_icon_adjust ) ]
-            
             regions = [ ]
 
-            for issue in group:
-                line = issue.line
-                if line in added_lines: continue
+            for line in sorted(lines):
+                if not (0 < line <= line_count): continue
 
-                regions.append(sublime.Region(
-                    view.text_point(line - 1, 0),
-                    view.text_point(line, 0) - 1
-                ))
+                start = line_starts[line - 1]
+                end = line_starts[line] - 1 if line < line_count else view_size
+
+                regions.append(sublime.Region(start, end))
             
             view.add_regions(region_key, regions, scope, gutter_icon_path, flags)
+
+        self.region_fingerprints = fingerprints
+        self.drawn_change_count = view.change_count()
             
 
 class WindowManager:
@@ -320,11 +487,13 @@ class WindowManager:
         self.setup_panel()
 
         self.phantom_dicts = [ ]
-        self.image_cache = { }
         self.issues = None
+        self.displayed_issues = None
+        self.issues_timeout = None
         
         self.status_message = None
         self.status_spinner = None
+        self.status_timeout = None
         self.spinner_timeout = None
         self.spinner_index  = 0
 
@@ -344,30 +513,27 @@ class WindowManager:
         for key, value in IssuePanelSettings.items():
             panel_settings.set(key, value)
 
-        if sBuildSockPlugin.settings["colorize_issue_panel"]:
+        settings = sBuildSockPlugin.settings
+
+        if settings.colorize_issue_panel:
             panel.assign_syntax("Packages/BuildSock/resources/IssuePanel.sublime-syntax")
         else:
             panel.assign_syntax("Packages/Text/Plain text.tmLanguage")
 
-        for key, value in sBuildSockPlugin.settings["issue_panel_settings"].items():
+        for key, value in settings.issue_panel_settings.items():
             panel_settings.set(key, value)
         
         panel.set_read_only(True)
 
 
-    def _make_data_url(self, mime_type: str, resource_path: str) -> str:
-        cache_key = (mime_type, resource_path)
-        
-        if result := self.image_cache.get(cache_key):
-            return result
+    def _get_icon_metrics(self) -> tuple[int, int]:
+        issue_icon_adjust = sBuildSockPlugin.settings.issue_icon_adjust
+        line_height = self.panel.line_height()
 
-        data_bytes  = sublime.load_binary_resource(resource_path)
-        data_string = base64.b64encode(data_bytes).decode("ascii")
+        size = self.panel.settings().get("font_size")
+        padding_top = int((line_height - size) / 2) + issue_icon_adjust
 
-        result = f"data:{mime_type};base64,{data_string}"
-        self.image_cache[cache_key] = result
-        
-        return result
+        return ( size, padding_top )
 
 
     def _make_left_phantom_html(
@@ -375,52 +541,23 @@ class WindowManager:
         issue: Issue,
         disclosure_icon: DisclosureIcon,
         show_disclosures: bool,
-        show_issue_icons: bool
+        show_issue_icons: bool,
+        icon_metrics: tuple[int, int]
     ) -> str:
-        issue_type = issue.type
+        size, padding_top = icon_metrics
         tooltip = html.escape(issue.tooltip) if issue.tooltip else ""
 
-        disclosure_light_path = DisclosureImageMap[ ( Theme.LIGHT, disclosure_icon ) ]
-        disclosure_dark_path  = DisclosureImageMap[ ( Theme.DARK,  disclosure_icon ) ]
-
-        icon_path = IssueIconMap[issue_type]
-            
-        disclosure_light_url = self._make_data_url("image/png", disclosure_light_path)
-        disclosure_dark_url  = self._make_data_url("image/png", disclosure_dark_path)
-        icon_url             = self._make_data_url("image/png", icon_path)
-
-        image_htmls = [ ]
-
-        issue_icon_adjust = sBuildSockPlugin.settings["issue_icon_adjust"]
-        line_height = self.panel.line_height()
-
-        size = self.panel.settings().get("font_size")
-        padding_top = int((line_height - size) / 2) + issue_icon_adjust
-        
-        if show_disclosures:
-            image_htmls.append(f'<img id="light-disclosure" width="{size}" height="{size}" src="{disclosure_light_url}">')
-            image_htmls.append(f'<img id="dark-disclosure"  width="{size}" height="{size}" src="{disclosure_dark_url }">')
-        
-        if show_issue_icons:
-            image_htmls.append(f'<img width="{size}" height="{size}" src="{icon_url}">')
-
-        return """
-            <body id="build-sock-left">
-                <style>
-                    body { padding-top: %ipx; }
-                    .dark  #light-disclosure { display: none }
-                    .light #dark-disclosure  { display: none }
-                </style>
-                <a href="toggle:" title="%s">%s</a>
-            </body>
-        """ % (padding_top, tooltip, "".join(image_htmls))
+        images_html = get_left_phantom_images_html(
+            disclosure_icon, issue.type, show_disclosures, show_issue_icons, size
+        )
 
-        return result
+        return LeftPhantomTemplate % (padding_top, tooltip, images_html)
 
 
     def _make_details_phantom_html(self, details: str) -> None:
-        font_face = sBuildSockPlugin.settings["details_font_face"]
-        font_size = sBuildSockPlugin.settings["details_font_size"]
+        settings  = sBuildSockPlugin.settings
+        font_face = settings.details_font_face
+        font_size = settings.details_font_size
         
         if isinstance(font_size, (int, float)):
             font_size_unit = f"{font_size}px;"
@@ -499,6 +636,10 @@ class WindowManager:
         
         self.window.destroy_output_panel("BuildSockIssues")
 
+        if self.issues_timeout:
+            self.issues_timeout.cancel()
+            self.issues_timeout = None
+
         if self.spinner_timeout:
             self.spinner_timeout.cancel()
             self.spinner_timeout = None
@@ -509,24 +650,19 @@ class WindowManager:
         panel = self.panel
 
         panel.set_read_only(False)
-        panel.run_command("select_all")
-        panel.run_command("right_delete")
+        panel.run_command("build_sock_clear")
+
+        icon_metrics = self._get_icon_metrics()
+
+        messages = [ ]
+        regions = [ ]
+        offset = panel.size()
 
-        phantom_dicts = [ ]
-        i = 0
-        
         show_disclosures = False
         show_issue_icons = False
-        
-        for issue in issues:
-            if issue.details != None:
-                show_disclosures = True
-            if issue.type != IssueType.GENERIC:
-                show_issue_icons = True
 
+        # First pass: collect messages and determine which phantom columns are needed
         for issue in issues:
-            region = sublime.Region(panel.size())
-            
             message = "{}\n".format(issue.message or "")
             if issue.file and issue.line and issue.column:
                 message = f"{issue.file}:{issue.line}:{issue.column} {message}"
@@ -535,13 +671,25 @@ class WindowManager:
             elif issue.file:
                 message = f"{issue.file} {message}"
             
-            panel.run_command("append", { "characters": message, "scroll_to_end": True })
+            messages.append(message)
+            regions.append(sublime.Region(offset))
+            offset += len(message)
+
+            show_disclosures = show_disclosures or issue.details is not None
+            show_issue_icons = show_issue_icons or issue.type != IssueType.GENERIC
 
+        # Write all messages with a single command
+        panel.run_command("append", { "characters": "".join(messages), "scroll_to_end": True })
+
+        phantom_dicts = [ ]
+
+        # Second pass: build phantoms now that the columns are known
+        for i, ( issue, region ) in enumerate(zip(issues, regions)):
             if issue.details:
-                collapsed_html    = self._make_left_phantom_html(issue, DisclosureIcon.COLLAPSED, show_disclosures, show_issue_icons)
+                collapsed_html    = self._make_left_phantom_html(issue, DisclosureIcon.COLLAPSED, show_disclosures, show_issue_icons, icon_metrics)
                 collapsed_phantom = sublime.Phantom(region, collapsed_html, sublime.PhantomLayout.INLINE, lambda str, i=i: self._handle_phantom_toggle(i))
 
-                expanded_html     = self._make_left_phantom_html(issue, DisclosureIcon.EXPANDED, show_disclosures, show_issue_icons)
+                expanded_html     = self._make_left_phantom_html(issue, DisclosureIcon.EXPANDED, show_disclosures, show_issue_icons, icon_metrics)
                 expanded_phantom  = sublime.Phantom(region, expanded_html, sublime.PhantomLayout.INLINE, lambda str, i=i: self._handle_phantom_toggle(i))
              
                 details_html      = self._make_details_phantom_html(issue.details)
@@ -554,7 +702,7 @@ class WindowManager:
                 }
 
             else:
-                left_html = self._make_left_phantom_html(issue, DisclosureIcon.NONE, show_disclosures, show_issue_icons)
+                left_html = self._make_left_phantom_html(issue, DisclosureIcon.NONE, show_disclosures, show_issue_icons, icon_metrics)
                 left_phantom = sublime.Phantom(region, left_html, sublime.PhantomLayout.INLINE) 
 
                 phantom_dict = {
@@ -564,44 +712,92 @@ class WindowManager:
                 }
                 
             phantom_dicts.append(phantom_dict)
-            i = i + 1
 
         panel.set_read_only(True)
         self.phantom_set.update([ ])
         self.panel.erase_phantoms("BuildSockIssues")
 
         self.phantom_dicts = phantom_dicts
+        self.displayed_issues = issues
         self.window.run_command("show_panel", { "panel": "output.BuildSockIssues" })
 
         self._update_phantoms()
 
 
+    def _flush_issues(self) -> None:
+        self.issues_timeout = None
+        self._update_issues()
+
+
     def show_issues(self, project: Project) -> None:
+        # Status-only projects, or projects whose issues were hidden, have no panel to show
+        if project.issues is None: return
+
+        # Already displaying these issues, just make sure the panel is visible.
+        # Compare against displayed_issues rather than self.issues, which is
+        # also set by rebuilds that hide_issues() later cancels.
+        if project.issues is self.displayed_issues and not self.issues_timeout:
+            self.window.run_command("show_panel", { "panel": "output.BuildSockIssues" })
+            return
+
         self.issues = project.issues
         self.panel.settings().set("result_base_dir", project.path)
-        self._update_issues()
+
+        # Coalesce rapid show_issues() calls into a single panel rebuild
+        if not self.issues_timeout:
+            self.issues_timeout = Timeout(lambda: self._flush_issues(), CoalesceDelay)
         
 
     def hide_issues(self) -> None:
+        if self.issues_timeout:
+            self.issues_timeout.cancel()
+            self.issues_timeout = None
+
         self.window.run_command("hide_panel", { "panel": "output.BuildSockIssues" })
 
 
-    def show_status(self,  project: Project) -> None:
-        self.status_message = project.status_message
-        self.status_spinner = project.status_spinner
+    def _flush_status(self) -> None:
+        self.status_timeout = None
         self.spinner_index  = 0
 
+        if self.spinner_timeout:
+            self.spinner_timeout.cancel()
+            self.spinner_timeout = None
+
         if self.status_spinner:
             self._update_spinner()        
         else:
             self.window.status_message(self.status_message)
 
 
+    def show_status(self,  project: Project) -> None:
+        self.status_message = project.status_message
+        self.status_spinner = project.status_spinner
+
+        # Coalesce rapid show_status() calls into a single status bar update
+        if not self.status_timeout:
+            self.status_timeout = Timeout(lambda: self._flush_status(), CoalesceDelay)
+
+
     def hide_status(self) -> None:
+        if self.status_timeout:
+            self.status_timeout.cancel()
+            self.status_timeout = None
+
+        if self.spinner_timeout:
+            self.spinner_timeout.cancel()
+            self.spinner_timeout = None
+
         self.window.status_message("")
 
 
 
+class BuildSockClearCommand(sublime_plugin.TextCommand):
+
+    def run(self, edit: sublime.Edit) -> None:
+        self.view.erase(edit, sublime.Region(0, self.view.size()))
+
+
 class Listener(sublime_plugin.EventListener):
 
     def on_new_window(self, window: sublime.Window):
@@ -610,6 +806,13 @@ class Listener(sublime_plugin.EventListener):
     def on_pre_close_window(self, window: sublime.Window):
         Timeout(lambda: sBuildSockPlugin.handle_close_window(window))
 
+    def on_load_project(self, window: sublime.Window):
+        if sBuildSockPlugin: sBuildSockPlugin.check_window_folders(window)
+
+    def on_post_window_command(self, window: sublime.Window, command_name: str, args: dict):
+        if command_name not in FolderCommandNames: return
+        if sBuildSockPlugin: sBuildSockPlugin.check_window_folders(window)
+
     def on_load(self, view: View):
         Timeout(lambda: sBuildSockPlugin.handle_load(view))
 
@@ -622,7 +825,8 @@ class Listener(sublime_plugin.EventListener):
 
 class SocketConnection:
 
-    def __init__(self, conn, addr, callback: Callable[[any], None]) -> None:
+    def __init__(self, server: SocketServer, conn, addr, callback: Callable[[Any, int], None]) -> None:
+        self.server = server
         self.conn = conn
         self.addr = addr
         self.callback = callback
@@ -643,34 +847,45 @@ class SocketConnection:
         self.read_thread.join()
 
 
-    def is_active(self) -> bool:
-        return self.read_thread.is_alive()
-
-
     def _read_connection(self) -> None:
         try:
-            f = self.conn.makefile()
-            contents = json.loads(f.read())
+            chunks = [ ]
+
+            while True:
+                chunk = self.conn.recv(65536)
+                if not chunk: break
+                chunks.append(chunk)
+
             self.conn.close()
 
-            self.callback(contents)
+            data = b"".join(chunks)
+
+            # Both orjson and json accept bytes directly. Hashing the raw bytes
+            # is far cheaper than re-encoding the decoded payload to detect resends.
+            contents = json_loads(data)
+
+            self.callback(contents, hash(data))
         except Exception as e:
             if self.stop_event.is_set():
                 pass # Ignore, we are shutting down
             else:
                 print("SocketConnection._read_connection() threw:", e)
 
+        finally:
+            self.server._remove_connection(self)
+
 
 
 class SocketServer:
 
-    def __init__(self, socket_path: str, callback: Callable[[dict], None]) -> None:
+    def __init__(self, socket_path: str, callback: Callable[[Any, int], None]) -> None:
         self.socket_path = socket_path
         self.socket = None
         self.wait_for_connection_thread = None
         self.stop_event = None
         self.callback = callback
         self.connections = set()
+        self.connections_lock = threading.Lock()
 
     
     def start(self):
@@ -706,17 +921,26 @@ class SocketServer:
         self.socket.close()
         self.wait_for_connection_thread.join()
 
-        for connection in self.connections:
+        with self.connections_lock:
+            connections = list(self.connections)
+            self.connections.clear()
+
+        # Stop outside of the lock, as each connection removes itself on exit
+        for connection in connections:
             connection.stop()
     
         self.socket = None
         self.stop_event = None
         self.wait_for_connection_thread = None
-        self.connections = set()
 
         self._remove_socket()
 
 
+    def _remove_connection(self, connection: SocketConnection) -> None:
+        with self.connections_lock:
+            self.connections.discard(connection)
+
+
     def _remove_socket(self):
         try:
             os.remove(self.socket_path)
@@ -728,15 +952,11 @@ class SocketServer:
         try:
             while not self.stop_event.is_set():
                 conn, addr = self.socket.accept()
-                connection = SocketConnection(conn, addr, self.callback)
-
-                # Prune connection list
-                connections = set()
-                for connection in self.connections:
-                    if connection.is_active():
-                        connections.add(connection)
 
-                self.connections = connections
+                # Hold the lock so a fast connection can't remove itself before it is added
+                with self.connections_lock:
+                    connection = SocketConnection(self, conn, addr, self.callback)
+                    self.connections.add(connection)
 
         except ConnectionAbortedError:
             pass
@@ -746,20 +966,86 @@ class SocketServer:
 
 
 
+# Writes tracebacks to the console from a background thread, so a stream of
+# malformed messages can't stall the thread that reported them.
+# Only the most recent entries are kept if the writer falls behind.
+class ErrorLog:
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.entries = collections.deque(maxlen=max_entries)
+        self.event = threading.Event()
+        self.stopped = False
+
+        self.write_thread = threading.Thread(target=self._write_entries, daemon=True)
+        self.write_thread.start()
+
+
+    def append(self, text: str) -> None:
+        self.entries.append(text)
+        self.event.set()
+
+
+    def stop(self) -> None:
+        self.stopped = True
+        self.event.set()
+
+
+    def _write_entries(self) -> None:
+        while True:
+            self.event.wait()
+            self.event.clear()
+
+            texts = [ ]
+            while self.entries:
+                texts.append(self.entries.popleft())
+
+            if texts:
+                sys.stderr.write("".join(texts))
+
+            if self.stopped:
+                return
+
+
+
+# Accumulates the effects of a batch of commands
+class CommandState:
+
+    def __init__(self) -> None:
+        self.needs_view_update = False
+        self.should_clear = False
+
+        # Only the last issues/status command in a batch is applied to managers
+        self.issues_action = None
+        self.status_action = None
+
+
+
 class BuildSockPlugin():
 
     def __init__(self) -> None:
         self.path_to_project_map   = { }
+        self.path_to_issues_map    = None
+        self.path_to_windows_map   = None
+        self.window_to_folders_map = { }
         self.window_to_manager_map = { }
         self.view_to_manager_map   = { }
         self.socket_server = None
+        self.error_log = ErrorLog()
+        self.parsed_issues_map = { }
+        self.parsed_issues_lock = threading.Lock()
+        self.region_style_table = { }
+        self.dirty_view_managers = set()
+        self.view_update_pending = False
+        self.flush_timeout = None
+        self.destroyed = False
         
         self.settings = BuildSockSettings(lambda: self.handle_settings_changed())
         self.handle_settings_changed()
 
 
     def handle_settings_changed(self) -> None:
-        self.update_socket_server(self.settings["socket_path"])
+        self._rebuild_region_style_table()
+        self.update_socket_server(self.settings.socket_path)
         
         for manager in self.window_to_manager_map.values():
             manager.handle_settings_changed()
@@ -768,6 +1054,32 @@ class BuildSockPlugin():
             manager.handle_settings_changed()
 
 
+    def _rebuild_region_style_table(self) -> None:
+        settings = self.settings
+        gutter_icon_adjust = settings.gutter_icon_adjust
+
+        scope_map = {
+            IssueType.GENERIC: settings.generic_issue_scope,
+            IssueType.INFO:    settings.info_issue_scope,
+            IssueType.WARNING: settings.warning_issue_scope,
+            IssueType.ERROR:   settings.error_issue_scope
+        }
+
+        gutter_icon_map = {
+            IssueType.WARNING: GutterIcon.TRIANGLE,
+            IssueType.ERROR:   GutterIcon.OCTOGON
+        }
+
+        table = { }
+
+        for issue_type in IssueType:
+            gutter_icon = gutter_icon_map.get(issue_type, GutterIcon.DOT)
+            gutter_icon_path = GutterIconMap[ ( gutter_icon, gutter_icon_adjust ) ]
+            table[issue_type] = ( scope_map[issue_type], gutter_icon_path )
+
+        self.region_style_table = table
+
+
     def update_socket_server(self, socket_path: str) -> None:
         existing_socket_path = None
 
@@ -776,94 +1088,250 @@ class BuildSockPlugin():
             
         if existing_socket_path != socket_path:
             if self.socket_server: self.socket_server.stop()
-            callback = lambda s: Timeout(lambda: self.handle_json(s))
-            self.socket_server = SocketServer(socket_path, callback)
+            self.socket_server = SocketServer(socket_path, self.handle_socket_json)
             self.socket_server.start()
 
 
+    # Called on a connection thread. Decode there, then use sublime.set_timeout()
+    # directly rather than Timeout, as sTimeouts is only safe to touch from the main thread.
+    def handle_socket_json(self, in_json: Any, digest: Optional[int] = None) -> None:
+        if root := self.decode_json(in_json, digest):
+            sublime.set_timeout(lambda: self._apply_root(root))
+
+
+    def _apply_root(self, root: tuple[str, list[tuple[str, Any]]]) -> None:
+        # cleanup_plugin() can't cancel raw set_timeout() callbacks, so drop
+        # any that arrive after destroy()
+        if self.destroyed: return
+
+        try:
+            self.handle_root(*root)
+        except Exception:
+            self.error_log.append(traceback.format_exc())
+
+
     def get_window_manager(self, window: sublime.Window) -> WindowManager:
-        manager = self.window_to_manager_map.get(window)
+        # Keyed by id(), which avoids hashing/comparing sublime.Window objects
+        window_id = window.id()
+        manager = self.window_to_manager_map.get(window_id)
 
         if not manager:
             manager = WindowManager(window)
-            self.window_to_manager_map[window] = manager
+            self.window_to_manager_map[window_id] = manager
         
         return manager
 
 
+    # Path must already be normalized with normalize_path()
+    def get_windows_for_path(self, path: str) -> list[sublime.Window]:
+        # Rebuild the folder index only after it has been invalidated
+        if self.path_to_windows_map is None:
+            self._rebuild_window_folders()
+
+        windows = self.path_to_windows_map.get(path)
+
+        # Folders added through dialogs or drag-and-drop don't run a window command.
+        # On a miss, rebuild only if some window's folders differ from the index.
+        if not windows and self._window_folders_changed():
+            self._rebuild_window_folders()
+            windows = self.path_to_windows_map.get(path)
+
+        return windows or [ ]
+
+
+    def _rebuild_window_folders(self) -> None:
+        path_to_windows_map   = { }
+        window_to_folders_map = { }
+
+        for window in sublime.windows():
+            folders = tuple(window.folders())
+            window_to_folders_map[window.id()] = folders
+
+            for folder in folders:
+                windows = path_to_windows_map.setdefault(normalize_path(folder), [ ])
+                if window not in windows: windows.append(window)
+
+        self.path_to_windows_map   = path_to_windows_map
+        self.window_to_folders_map = window_to_folders_map
+
+
+    def _window_folders_changed(self) -> bool:
+        window_to_folders_map = self.window_to_folders_map
+        windows = sublime.windows()
+
+        if len(windows) != len(window_to_folders_map):
+            return True
+
+        for window in windows:
+            if tuple(window.folders()) != window_to_folders_map.get(window.id()):
+                return True
+
+        return False
+
+
+    def check_window_folders(self, window: sublime.Window) -> None:
+        if tuple(window.folders()) != self.window_to_folders_map.get(window.id()):
+            self.invalidate_window_folders()
+
+
+    def invalidate_window_folders(self) -> None:
+        self.path_to_windows_map = None
+
+
     def update_window_with_project(self, window: sublime.Window, project: Project):
         manager = self.get_window_manager(window)
         manager.show_issues(project)
         manager.show_status(project)
 
 
-    def update_views(self, views: list[View]) -> None:
-        path_to_views_map  = { }
-        path_to_issues_map = { }
+    def set_project_issues(self, project: Project, issues: Optional[list[Issue]]) -> None:
+        project.set_issues(issues)
+        self.path_to_issues_map = None
+
+
+    def get_path_to_issues_map(self) -> dict[str, set[Issue]]:
+        # Merge the per-project maps, only when a project's issues have changed
+        if self.path_to_issues_map is None:
+            path_to_issues_map = { }
+
+            for project in self.path_to_project_map.values():
+                for path, issue_set in project.path_to_issues_map.items():
+                    if existing_set := path_to_issues_map.get(path):
+                        issue_set = existing_set | issue_set
+
+                    path_to_issues_map[path] = issue_set
+
+            self.path_to_issues_map = path_to_issues_map
+
+        return self.path_to_issues_map
+
+
+    def update_views(self, view_paths: list[tuple[sublime.View, str]], force: bool = False) -> None:
+        path_to_issues_map = self.get_path_to_issues_map()
+
+        for view, path in view_paths:
+            issues = path_to_issues_map.get(path)
+            manager = self.view_to_manager_map.get(view)
+
+            # Ensure a ViewManager exists for each view with issues
+            if not manager:
+                if not issues: continue
+
+                manager = ViewManager(view)
+                self.view_to_manager_map[view] = manager
+
+            manager.pending_issues = issues
+            if force: manager.pending_force = True
+
+            self._mark_dirty(manager)
+
+
+    # A project resending identical issues confirms their lines against the saved
+    # files. Redraw its views, as edits may have collapsed or shifted the regions.
+    def _redraw_project_views(self, project: Project) -> None:
+        path_to_issues_map = project.path_to_issues_map
+        view_paths = [ ]
+
+        for view in self.view_to_manager_map:
+            if (path := view.file_name()) in path_to_issues_map:
+                view_paths.append(( view, path ))
+
+        self.update_views(view_paths, force = True)
+
+
+    def _schedule_flush(self) -> None:
+        if not self.flush_timeout:
+            self.flush_timeout = Timeout(lambda: self._flush_dirty(), CoalesceDelay)
 
-        for view in views:
-            file_name = view.file_name()
-            if not file_name: continue
-                
-            view_set = path_to_views_map.get(file_name) or set()
-            view_set.add(view)
-            path_to_views_map[file_name] = view_set
-
-        for project in self.path_to_project_map.values():
-            if project.issues:
-                for issue in project.issues:
-                    if not issue.path: continue
-                    
-                    issue_set = path_to_issues_map.get(issue.path) or set()
-                    issue_set.add(issue)
-                    path_to_issues_map[issue.path] = issue_set
-
-        # Ensure a ViewManager exists for each view with issues
-        for path in set(path_to_views_map.keys()) & set(path_to_issues_map.keys()):
-            views  = path_to_views_map[path]
-            for view in views:
-                if not view in self.view_to_manager_map:
-                    self.view_to_manager_map[view] = ViewManager(view)              
-    
-        # Update all managed views
-        for view, manager in self.view_to_manager_map.items():
-            issues = path_to_issues_map.get(view.file_name(), None)
-            manager.set_issues(issues)
+
+    def _mark_dirty(self, manager: ViewManager) -> None:
+        self.dirty_view_managers.add(manager)
+        self._schedule_flush()
+
+
+    def _schedule_view_update(self) -> None:
+        self.view_update_pending = True
+        self._schedule_flush()
+
+
+    def _flush_dirty(self) -> None:
+        # Runs while flush_timeout is still set, so the managers it marks
+        # dirty are flushed below rather than scheduling another pass.
+        if self.view_update_pending:
+            self.view_update_pending = False
+            self.update_all_views()
+
+        managers = self.dirty_view_managers
+
+        self.dirty_view_managers = set()
+        self.flush_timeout = None
+
+        for manager in managers:
+            manager.set_issues(manager.pending_issues, manager.pending_force)
+            manager.pending_force = False
+
+
+    def _prune_managers(self) -> None:
+        # Catch views and windows whose close events were missed
+        for view in [ v for v in self.view_to_manager_map if not v.is_valid() ]:
+            self.handle_close(view)
+
+        for manager in [ m for m in self.window_to_manager_map.values() if not m.window.is_valid() ]:
+            self.handle_close_window(manager.window)
 
 
     def update_all_views(self):
-        views = [ ]
+        self._prune_managers()
+
+        view_paths = [ ]
         
         for window in sublime.windows():
             for view in window.views(include_transient = True):
-                if not view.file_name: continue
-                views.append(view)
+                file_name = view.file_name()
+                if not file_name: continue
+                view_paths.append(( view, file_name ))
         
-        self.update_views(views)
+        self.update_views(view_paths)
             
 
     def handle_new_window(self, window: sublime.Window):
+        self.invalidate_window_folders()
+
         for folder in window.folders():
-            if project := self.path_to_project_map.get(folder):
+            if project := self.path_to_project_map.get(normalize_path(folder)):
                 self.update_window_with_project(window, project)
 
 
     def handle_close_window(self, window: sublime.Window):
-        if window in self.window_to_manager_map:
-            del self.window_to_manager_map[window]
+        self.invalidate_window_folders()
+
+        self.window_to_manager_map.pop(window.id(), None)
 
 
     def handle_load(self, view: sublime.View):
-        self.update_views([ view ])
+        if file_name := view.file_name():
+            self.update_views([ ( view, file_name ) ])
 
 
     def handle_close(self, view: sublime.View):
         if view in self.view_to_manager_map:
-            self.view_to_manager_map[view].destroy()
+            manager = self.view_to_manager_map[view]
+            manager.destroy()
+
+            self.dirty_view_managers.discard(manager)
             del self.view_to_manager_map[view]
 
 
     def destroy(self):
+        self.destroyed = True
+
+        if self.flush_timeout:
+            self.flush_timeout.cancel()
+            self.flush_timeout = None
+
+        self.dirty_view_managers = set()
+        self.view_update_pending = False
+
         for manager in self.window_to_manager_map.values():
             manager.destroy()
 
@@ -871,131 +1339,241 @@ class BuildSockPlugin():
             manager.destroy()
 
         self.path_to_project_map = { }
+        self.path_to_issues_map = None
+        self.path_to_windows_map = None
+        self.window_to_folders_map = { }
         self.window_to_manager_map = { } 
         
         if self.socket_server:
             self.socket_server.stop()
 
+        self.error_log.stop()
 
-    def handle_json(self, in_json: dict):
 
-        def check_type(x: Any, type: Any, default: Any = None) -> Any:
-            return x if isinstance(x, type) else default
-
-        def parse_status_spinner(in_any: any) -> Optional[list[str]]:
-            if isinstance(in_any, str):
-                if result := sSpinners.get(in_any):
-                    return result
-            elif isinstance(in_any, list):
-                for s in in_any:
-                    if not isinstance(s, str):
-                        return None
-                
+    @staticmethod
+    def _parse_status_spinner(in_any: Any) -> Optional[list[str]]:
+        if isinstance(in_any, str):
+            if result := sSpinners.get(in_any):
+                return result
+        elif isinstance(in_any, list):
+            if all(isinstance(s, str) for s in in_any):
                 return in_any
-            else:
-                return None
-
-        def parse_issue_type(in_str: str) -> IssueType:
-            return {
-                "info":    IssueType.INFO,
-                "warning": IssueType.WARNING,
-                "error":   IssueType.ERROR
-            }.get(in_str, IssueType.GENERIC)
-
-        def parse_issue(in_issue: dict, project_path: str) -> Issue:
-            message = check_type(in_issue.get("message"),  str, "")
-            file    = check_type(in_issue.get("file"),     str)
-            line    = check_type(in_issue.get("line"),     int)
-            column  = check_type(in_issue.get("column"),   int)
-            details = check_type(in_issue.get("details"),  str)
-            tooltip = check_type(in_issue.get("tooltip"),  str)
-            type    = parse_issue_type(in_issue.get("type"))
-            
-            path = os.path.join(project_path, file) if file else None
 
-            return Issue(type, message, path, file, line, column, details, tooltip)
+        return None
 
-        def parse_issues(in_issues: list[dict], project_path: str) -> list[Issue]:
-            return [ parse_issue(x, project_path) for x in in_issues ]
-        
-        def parse_root(in_root: dict) -> None:
-            project_path = check_type(in_root.get("project"), str)
-            in_commands  = check_type(in_root.get("commands"), list, [ ])
 
-            if project_path == None: return
+    @staticmethod
+    def _parse_issue_fields(in_issue: dict, project_path: str, file_to_path_map: dict[str, str]) -> tuple:
+        get = in_issue.get
 
-            project = self.path_to_project_map.get(project_path)
-            if not project:
-                project = Project(project_path)
-                self.path_to_project_map[project_path] = project
-                
-            current_project_path = project_path
+        message = get("message")
+        file    = get("file")
+        line    = get("line")
+        column  = get("column")
+        details = get("details")
+        tooltip = get("tooltip")
 
-            managers = [ ]
-            needs_view_update = False
-            should_clear = False
+        # Called once per issue, so check types inline rather than via check_type()
+        if type(message) is not str: message = ""
+        if type(file)    is not str: file    = None
+        if type(line)    is not int: line    = None
+        if type(column)  is not int: column  = None
+        if type(details) is not str: details = None
+        if type(tooltip) is not str: tooltip = None
 
-            for window in sublime.windows():
-                for folder in window.folders():
-                    if folder == project_path:
-                        managers.append(self.get_window_manager(window))
-                        break
+        issue_type = IssueTypeMap.get(get("type"), IssueType.GENERIC)
 
-            for in_command in in_commands:
-                command_type = check_type(in_command.get("command"), str)
+        # Many issues share a file, intern it and reuse the joined path
+        path = None
 
-                if command_type == "show-issues":
-                    in_issues = check_type(in_command.get("issues"), list, [ ])
-                    issues = parse_issues(in_issues, project_path)
+        if file:
+            file = sys.intern(file)
+            path = file_to_path_map.get(file)
 
-                    project.issues = issues
-                    for m in managers: m.show_issues(project)
+            if not path:
+                path = sys.intern(os.path.join(project_path, file))
+                file_to_path_map[file] = path
 
-                    needs_view_update = True
+        return ( issue_type, message, path, file, line, column, details, tooltip )
 
-                elif command_type == "hide-issues":
-                    project.issues = None
-                    for m in managers: m.hide_issues()
 
-                    needs_view_update = True
+    # Rebuilds usually re-send the same issues. Reusing the Issue objects from the
+    # project's previous parse lets unchanged issue sets compare equal by identity
+    # downstream. Issues are shared, so they must not be mutated after creation.
+    # Returns the issues and the memo to pass to the next parse.
+    @staticmethod
+    def _parse_issues(in_issues: list[dict], project_path: str, issue_memo: dict[tuple, Issue]) -> tuple[list[Issue], dict[tuple, Issue]]:
+        parse_issue_fields = BuildSockPlugin._parse_issue_fields
+        file_to_path_map = { }
+        memo_get = issue_memo.get
 
-                elif command_type == "show-status":
-                    status_message = check_type(in_command.get("message"), str)
-                    status_spinner = parse_status_spinner(in_command.get("spinner"))
+        issues = [ ]
+        next_memo = { }
 
-                    project.status_message = status_message
-                    project.status_spinner = status_spinner
+        for in_issue in in_issues:
+            fields = parse_issue_fields(in_issue, project_path, file_to_path_map)
 
-                    for m in managers: m.show_status(project)
+            issue = memo_get(fields)
+            if issue is None: issue = Issue(*fields)
 
-                elif command_type == "hide-status":
-                    project.status_message = None
-                    project.status_spinner = None
+            next_memo[fields] = issue
+            issues.append(issue)
 
-                    for m in managers: m.hide_status()
+        return issues, next_memo
 
-                elif command_type == "clear":
-                    should_clear = True
 
-            if should_clear:
-                for m in managers:
-                    m.destroy()
-                       
-                    if m.window in self.window_to_manager_map:
-                        del self.window_to_manager_map[m.window]
+    # Watch-mode rebuilds often resend an identical message. The digest is a hash
+    # of the message's raw bytes (plus the command's index), so a match means the
+    # issue list is unchanged. Reusing the previous Issue list lets handle_root()
+    # skip the update.
+    def _parse_issues_cached(self, in_issues: list[dict], project_path: str, digest: Optional[tuple]) -> list[Issue]:
+        key = normalize_path(project_path)
 
-                if project:
-                    project.issues = None
-                    self.update_all_views()
-                    del self.path_to_project_map[project_path]
+        with self.parsed_issues_lock:
+            cached = self.parsed_issues_map.get(key)
 
-            if needs_view_update:
-                self.update_all_views()
+        if digest is not None and cached and cached[0] == digest:
+            return cached[1]
 
-        root = check_type(in_json, dict, { })
-        
+        issues, issue_memo = self._parse_issues(in_issues, project_path, cached[2] if cached else { })
+
+        with self.parsed_issues_lock:
+            self.parsed_issues_map[key] = ( digest, issues, issue_memo )
+
+        return issues
+
+
+    def _parse_root(self, in_root: dict, digest: Optional[int]) -> Optional[tuple[str, list[tuple[str, Any]]]]:
+        project_path = check_type(in_root.get("project"), str)
+        in_commands  = check_type(in_root.get("commands"), list, [ ])
+
+        if project_path == None: return None
+
+        commands = [ ]
+
+        for index, in_command in enumerate(in_commands):
+            get = in_command.get
+
+            command_type = get("command")
+            if type(command_type) is not str: continue
+
+            if command_type == "show-issues":
+                in_issues = check_type(get("issues"), list, [ ])
+                issues_digest = ( digest, index ) if digest is not None else None
+                issues = self._parse_issues_cached(in_issues, project_path, issues_digest)
+
+                commands.append(( command_type, issues ))
+
+            elif command_type == "show-status":
+                status_message = check_type(get("message"), str)
+                status_spinner = self._parse_status_spinner(get("spinner"))
+
+                commands.append(( command_type, ( status_message, status_spinner ) ))
+
+            else:
+                commands.append(( command_type, None ))
+
+        return ( project_path, commands )
+
+
+    # Called on a connection thread. Converts the payload into Issue objects
+    # and plain command tuples, leaving only state updates for the main thread.
+    def decode_json(self, in_json: Any, digest: Optional[int] = None) -> Optional[tuple[str, list[tuple[str, Any]]]]:
         try:
-            parse_root(root)
+            return self._parse_root(check_type(in_json, dict, { }), digest)
         except Exception:
-            traceback.print_exc()
+            self.error_log.append(traceback.format_exc())
+            return None
+
+
+    # Called on the main thread with the result of decode_json()
+    def handle_root(self, project_path: str, commands: list[tuple[str, Any]]) -> None:
+        normalized_path = normalize_path(project_path)
+
+        project = self.path_to_project_map.get(normalized_path)
+        if not project:
+            project = Project(project_path)
+            self.path_to_project_map[normalized_path] = project
+
+        managers = [ ]
+        state = CommandState()
+
+        for window in self.get_windows_for_path(normalized_path):
+            managers.append(self.get_window_manager(window))
+
+        handlers = self.CommandHandlers
+
+        for command_type, payload in commands:
+            if handler := handlers.get(command_type):
+                handler(self, payload, project, managers, state)
+
+        if not state.should_clear:
+            for action in ( state.issues_action, state.status_action ):
+                if not action: continue
+                for m in managers: action(m)
+
+        if state.should_clear:
+            with self.parsed_issues_lock:
+                self.parsed_issues_map.pop(normalized_path, None)
+
+            for m in managers:
+                m.destroy()
+                   
+                self.window_to_manager_map.pop(m.window.id(), None)
+
+            self.set_project_issues(project, None)
+            del self.path_to_project_map[normalized_path]
+
+            state.needs_view_update = True
+
+        if state.needs_view_update:
+            self._schedule_view_update()
+
+
+    def _handle_show_issues(self, payload: list[Issue], project: Project, managers: list[WindowManager], state: CommandState) -> None:
+        # Identical issues are memoized to the same objects, so this compares
+        # by identity. Keep the existing list so views and panels can skip redrawing.
+        if payload != project.issues:
+            self.set_project_issues(project, payload)
+            state.needs_view_update = True
+        else:
+            self._redraw_project_views(project)
+
+        state.issues_action = lambda m: m.show_issues(project)
+
+
+    def _handle_hide_issues(self, payload: None, project: Project, managers: list[WindowManager], state: CommandState) -> None:
+        if project.issues is None: return
+
+        self.set_project_issues(project, None)
+        state.issues_action = lambda m: m.hide_issues()
+
+        state.needs_view_update = True
+
+
+    def _handle_show_status(self, payload: tuple, project: Project, managers: list[WindowManager], state: CommandState) -> None:
+        project.status_message, project.status_spinner = payload
+        state.status_action = lambda m: m.show_status(project)
+
+
+    def _handle_hide_status(self, payload: None, project: Project, managers: list[WindowManager], state: CommandState) -> None:
+        if project.status_message is None and project.status_spinner is None: return
+
+        project.status_message = None
+        project.status_spinner = None
+
+        state.status_action = lambda m: m.hide_status()
+
+
+    def _handle_clear(self, payload: None, project: Project, managers: list[WindowManager], state: CommandState) -> None:
+        state.should_clear = True
+
+
+    CommandHandlers = {
+        "show-issues": _handle_show_issues,
+        "hide-issues": _handle_hide_issues,
+        "show-status": _handle_show_status,
+        "hide-status": _handle_hide_status,
+        "clear":       _handle_clear
+    }
 